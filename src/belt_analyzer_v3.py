@@ -32,6 +32,23 @@ from scipy import signal as scipy_signal
 from scipy.fft import rfft, rfftfreq
 
 
+def _error(msg):
+    """Error-result shape shared by every early return in the pipeline."""
+    return {'error': msg}
+
+
+# Hann windows keyed by length — captures produce the same handful of
+# window sizes, so each is built once instead of per pluck
+_HANN_CACHE = {}
+
+
+def _hann_window(n):
+    window = _HANN_CACHE.get(n)
+    if window is None:
+        window = _HANN_CACHE[n] = np.hanning(n)
+    return window
+
+
 def find_peak_trigger(accel_magnitude, sample_rate):
     """
     Max-Peak Triggering - finds absolute maximum acceleration.
@@ -43,10 +60,19 @@ def find_peak_trigger(accel_magnitude, sample_rate):
     return peak_idx
 
 
+# Filter designs keyed on (sample rate, parameters) — iirnotch/butter
+# redo their design math every call, and repeated plucks from the same
+# ADXL hit the same rate
+_FILTER_CACHE = {}
+
+
 def apply_notch_filter(signal_data, sample_rate, notch_freq=176.0, quality=30.0):
     """Notch filter to remove structural resonance at 176Hz"""
-    b, a = scipy_signal.iirnotch(notch_freq, quality, sample_rate)
-    return scipy_signal.filtfilt(b, a, signal_data)
+    key = ('notch', sample_rate, notch_freq, quality)
+    ba = _FILTER_CACHE.get(key)
+    if ba is None:
+        ba = _FILTER_CACHE[key] = scipy_signal.iirnotch(notch_freq, quality, sample_rate)
+    return scipy_signal.filtfilt(ba[0], ba[1], signal_data)
 
 
 def apply_bandpass_filter(signal_data, sample_rate, low=90.0, high=140.0):
@@ -55,9 +81,14 @@ def apply_bandpass_filter(signal_data, sample_rate, low=90.0, high=140.0):
     Completely excludes 176Hz structural resonance.
     Isolates belt operating range only.
     """
-    nyq = sample_rate / 2.0
-    b, a = scipy_signal.butter(4, [low / nyq, high / nyq], btype='band')
-    return scipy_signal.filtfilt(b, a, signal_data)
+    key = ('band', sample_rate, low, high)
+    ba = _FILTER_CACHE.get(key)
+    if ba is None:
+        nyq = sample_rate / 2.0
+        ba = _FILTER_CACHE[key] = scipy_signal.butter(
+            4, [low / nyq, high / nyq], btype='band'
+        )
+    return scipy_signal.filtfilt(ba[0], ba[1], signal_data)
 
 
 def calculate_psd_welch(signal_data, sample_rate):
@@ -79,17 +110,28 @@ def calculate_psd_welch(signal_data, sample_rate):
     return freqs, psd
 
 
-def calculate_fft_zero_padded(signal_data, sample_rate):
+def calculate_fft_zero_padded(signal_data, sample_rate, band=None):
     """
     Zero-padded FFT (4x padding).
     Creates smoother spectrum for parabolic interpolation.
+
+    With band=(low, high) only the bins inside that range are
+    materialized — the magnitude pass runs over ~the belt band instead
+    of the full half-spectrum, and callers get band-local indices.
     """
     n_fft = 2 ** int(np.ceil(np.log2(len(signal_data))) + 2)
-    window = np.hanning(len(signal_data))
-    windowed = signal_data * window
-    spectrum = np.abs(rfft(windowed, n=n_fft))
-    freqs = rfftfreq(n_fft, 1.0 / sample_rate)
-    return freqs, spectrum
+    windowed = signal_data * _hann_window(len(signal_data))
+    spectrum = rfft(windowed, n=n_fft)
+
+    if band is None:
+        return rfftfreq(n_fft, 1.0 / sample_rate), np.abs(spectrum)
+
+    # Integer bin slice covering [low, high] inclusive
+    df = sample_rate / n_fft
+    lo = int(np.ceil(band[0] / df))
+    hi = min(int(np.floor(band[1] / df)), len(spectrum) - 1)
+    freqs = np.arange(lo, hi + 1) * df
+    return freqs, np.abs(spectrum[lo:hi + 1])
 
 
 def parabolic_interpolation(freqs, magnitudes, peak_idx):
@@ -110,9 +152,10 @@ def parabolic_interpolation(freqs, magnitudes, peak_idx):
     return freqs[peak_idx] + delta * freq_resolution
 
 
-def calculate_q_factor(freq, freqs, magnitudes):
+def calculate_q_factor(freq, freqs, magnitudes, peak_idx=None):
     """Calculate Q-factor (peak sharpness)"""
-    peak_idx = np.argmin(np.abs(freqs - freq))
+    if peak_idx is None:
+        peak_idx = np.argmin(np.abs(freqs - freq))
     peak_mag = magnitudes[peak_idx]
     half_power = peak_mag / np.sqrt(2)
 
@@ -145,10 +188,11 @@ def analyze_pluck_event(filepath, belt_name='Unknown', debug=False):
     11. Q-factor and confidence
     """
     try:
-        # STEP 1: Load data
-        data = np.genfromtxt(filepath, delimiter=',', skip_header=1)
+        # STEP 1: Load data — loadtxt uses NumPy's C reader (genfromtxt
+        # is pure Python and several times slower on these files)
+        data = np.loadtxt(filepath, delimiter=',', skiprows=1)
         if len(data) < 1000:
-            return {'error': 'Insufficient samples'}
+            return _error('Insufficient samples')
 
         times = data[:, 0]
         accel_x = data[:, 1]
@@ -180,7 +224,7 @@ def analyze_pluck_event(filepath, belt_name='Unknown', debug=False):
         end_idx = min(start_idx + int(1.0 * sample_rate), len(accel_magnitude))
 
         if (end_idx - start_idx) < 512:
-            return {'error': 'Insufficient data after trigger'}
+            return _error('Insufficient data after trigger')
 
         signal_window = accel_magnitude[start_idx:end_idx]
 
@@ -194,53 +238,47 @@ def analyze_pluck_event(filepath, belt_name='Unknown', debug=False):
         # STEP 6: Band-pass 90-140Hz
         signal_filtered = apply_bandpass_filter(signal_notched, sample_rate)
 
-        # STEP 7: Welch PSD for initial estimate
+        # STEP 7: Welch PSD for initial estimate — psd_freqs is sorted,
+        # so the belt band is a contiguous slice, not a boolean mask
         psd_freqs, psd_power = calculate_psd_welch(signal_filtered, sample_rate)
-        belt_mask = (psd_freqs >= 90) & (psd_freqs <= 140)
-        belt_psd_freqs = psd_freqs[belt_mask]
-        belt_psd_power = psd_power[belt_mask]
+        lo = np.searchsorted(psd_freqs, 90)
+        hi = np.searchsorted(psd_freqs, 140, side='right')
 
-        if len(belt_psd_freqs) == 0:
-            return {'error': 'No PSD data in belt range'}
+        if lo >= hi:
+            return _error('No PSD data in belt range')
 
-        psd_peak_freq = belt_psd_freqs[np.argmax(belt_psd_power)]
+        psd_peak_freq = psd_freqs[lo + np.argmax(psd_power[lo:hi])]
 
         if debug:
             print(f"PSD estimate: {psd_peak_freq:.1f}Hz")
 
-        # STEP 8: Zero-padded FFT
-        fft_freqs, fft_spectrum = calculate_fft_zero_padded(signal_filtered, sample_rate)
-
-        belt_fft_mask = (fft_freqs >= 90) & (fft_freqs <= 140)
-        belt_fft_freqs = fft_freqs[belt_fft_mask]
-        belt_fft_spectrum = fft_spectrum[belt_fft_mask]
+        # STEP 8: Zero-padded FFT, belt band only
+        belt_fft_freqs, belt_fft_spectrum = calculate_fft_zero_padded(
+            signal_filtered, sample_rate, band=(90, 140)
+        )
 
         if len(belt_fft_freqs) == 0:
-            return {'error': 'No FFT data in belt range'}
+            return _error('No FFT data in belt range')
 
-        # STEP 9: Peak near PSD estimate
-        search_mask = (belt_fft_freqs >= psd_peak_freq - 5) & \
-                      (belt_fft_freqs <= psd_peak_freq + 5)
+        # STEP 9: Peak near PSD estimate (±5Hz window as a slice)
+        lo = np.searchsorted(belt_fft_freqs, psd_peak_freq - 5)
+        hi = np.searchsorted(belt_fft_freqs, psd_peak_freq + 5, side='right')
 
-        if np.sum(search_mask) > 0:
-            local_peak_idx = np.argmax(belt_fft_spectrum[search_mask])
-            global_peak_idx = np.where(belt_fft_mask)[0][
-                np.where(search_mask)[0][local_peak_idx]
-            ]
+        if lo < hi:
+            peak_idx = lo + np.argmax(belt_fft_spectrum[lo:hi])
         else:
-            global_peak_idx = np.where(belt_fft_mask)[0][
-                np.argmax(belt_fft_spectrum)
-            ]
+            peak_idx = np.argmax(belt_fft_spectrum)
 
         # STEP 10: Parabolic interpolation
-        final_freq = parabolic_interpolation(fft_freqs, fft_spectrum, global_peak_idx)
+        final_freq = parabolic_interpolation(belt_fft_freqs, belt_fft_spectrum, peak_idx)
 
         if debug:
-            print(f"FFT peak: {fft_freqs[global_peak_idx]:.2f}Hz → "
+            print(f"FFT peak: {belt_fft_freqs[peak_idx]:.2f}Hz → "
                   f"Interpolated: {final_freq:.3f}Hz")
 
         # STEP 11: Q-factor and confidence
-        q_factor = calculate_q_factor(final_freq, belt_fft_freqs, belt_fft_spectrum)
+        q_factor = calculate_q_factor(final_freq, belt_fft_freqs, belt_fft_spectrum,
+                                      peak_idx=peak_idx)
 
         if q_factor > 50:
             confidence = "EXCELLENT"
@@ -269,14 +307,28 @@ def analyze_pluck_event(filepath, belt_name='Unknown', debug=False):
 analyze_pluck_v3 = analyze_pluck_event
 
 
-def main():
-    import sys
-    if len(sys.argv) < 2:
-        print("Usage: python3 belt_analyzer_v3.py <csv_file>")
-        sys.exit(1)
+def analyze_pluck_events(filepaths, belt_name='Unknown'):
+    """
+    Analyze several CSV files, one result dict per file.
 
-    result = analyze_pluck_event(sys.argv[1], debug=True)
-    print()
+    Each file is independent and CPU-bound (FFT dominates), so multiple
+    files are farmed out to a process pool — near-linear speedup on
+    multicore hosts (a Pi 4 has 4 cores). A single file, or any problem
+    spinning up workers, falls back to the sequential path.
+    """
+    filepaths = list(filepaths)
+    if len(filepaths) > 1:
+        try:
+            from concurrent.futures import ProcessPoolExecutor
+            with ProcessPoolExecutor(max_workers=len(filepaths)) as pool:
+                return list(pool.map(analyze_pluck_event, filepaths,
+                                     [belt_name] * len(filepaths)))
+        except (ImportError, OSError):
+            pass
+    return [analyze_pluck_event(fp, belt_name) for fp in filepaths]
+
+
+def _print_result(result):
     print("=" * 50)
     if 'error' in result:
         print(f"ERROR: {result['error']}")
@@ -290,5 +342,22 @@ def main():
     print("=" * 50)
 
 
+def main():
+    import sys
+    if len(sys.argv) < 2:
+        print("Usage: python3 belt_analyzer_v3.py <csv_file> [<csv_file> ...]")
+        sys.exit(1)
+
+    if len(sys.argv) == 2:
+        result = analyze_pluck_event(sys.argv[1], debug=True)
+        print()
+        _print_result(result)
+    else:
+        # Multiple files: analyze in parallel (debug output would interleave)
+        for filepath, result in zip(sys.argv[1:], analyze_pluck_events(sys.argv[1:])):
+            print(f"\n{filepath}")
+            _print_result(result)
+
+
 if __name__ == "__main__":
     main()
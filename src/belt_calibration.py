@@ -159,8 +159,11 @@ def calibration_test(belt_name):
     print("="*70)
     
     if valid_results:
-        errors = [abs(r['error']) for r in valid_results if r['manual'] > 0]
-        
+        # Filter once — every statistic below only looks at results with a
+        # manual reference reading
+        scored_results = [r for r in valid_results if r['manual'] > 0]
+        errors = [abs(r['error']) for r in scored_results]
+
         if errors:
             print()
             print("ACCURACY STATISTICS:")
@@ -170,9 +173,9 @@ def calibration_test(belt_name):
             print()
             
             # Group by target frequency
-            group_115 = [r for r in valid_results if 1 <= r['test_num'] <= 3 and r['manual'] > 0]
-            group_110 = [r for r in valid_results if 4 <= r['test_num'] <= 6 and r['manual'] > 0]
-            group_105 = [r for r in valid_results if 7 <= r['test_num'] <= 9 and r['manual'] > 0]
+            group_115 = [r for r in scored_results if 1 <= r['test_num'] <= 3]
+            group_110 = [r for r in scored_results if 4 <= r['test_num'] <= 6]
+            group_105 = [r for r in scored_results if 7 <= r['test_num'] <= 9]
             
             for group_name, group in [("~115 Hz", group_115), ("~110 Hz", group_110), ("~105 Hz", group_105)]:
                 if group:
@@ -184,7 +187,7 @@ def calibration_test(belt_name):
             print()
             
             # Check if we need calibration offset
-            avg_error_signed = sum(r['error'] for r in valid_results if r['manual'] > 0) / len([r for r in valid_results if r['manual'] > 0])
+            avg_error_signed = sum(r['error'] for r in scored_results) / len(scored_results)
             print(f"  Average signed error: {avg_error_signed:+.1f} Hz")
             if abs(avg_error_signed) > 3:
                 print(f"  → Recommendation: Apply calibration offset of {-avg_error_signed:.1f} Hz")
@@ -12,31 +12,43 @@ Usage (called by gcode_shell_command):
 """
 
 import requests
+import statistics
 import time
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 MOONRAKER_URL = "http://localhost:7125"
-
-# Import V3 analyzer — search common install locations
-_SEARCH_PATHS = [
-    os.path.dirname(os.path.abspath(__file__)),
-    os.path.expanduser("~/Live-Belt-Tension/src"),
-]
-for _p in _SEARCH_PATHS:
-    if os.path.exists(os.path.join(_p, "belt_analyzer_v3.py")):
-        sys.path.insert(0, _p)
-        break
-
-from belt_analyzer_v3 import analyze_pluck_event as _analyze_v3
+GCODE_SCRIPT_URL = f"{MOONRAKER_URL}/printer/gcode/script"
+MEASURE_START_CMD = "ACCELEROMETER_MEASURE CHIP=adxl345"
+
+# Keep-alive session — respond_msg hits Moonraker once per console
+# line, so a fresh TCP connection per call adds up fast on a Pi
+_SESSION = requests.Session()
+
+# Import V3 analyzer — when run as a script the analyzer sits next to
+# this file and imports directly; only probe install locations (and
+# grow sys.path) if that fails
+try:
+    from belt_analyzer_v3 import analyze_pluck_event as _analyze_v3
+except ImportError:
+    _SEARCH_PATHS = [
+        os.path.dirname(os.path.abspath(__file__)),
+        os.path.expanduser("~/Live-Belt-Tension/src"),
+    ]
+    for _p in _SEARCH_PATHS:
+        if os.path.exists(os.path.join(_p, "belt_analyzer_v3.py")):
+            sys.path.insert(0, _p)
+            break
+
+    from belt_analyzer_v3 import analyze_pluck_event as _analyze_v3
 
 
 def send_gcode(command):
     """Send G-code command to Klipper via Moonraker."""
     try:
-        url = f"{MOONRAKER_URL}/printer/gcode/script"
         params = {"script": command}
-        response = requests.post(url, params=params, timeout=10)
+        response = _SESSION.post(GCODE_SCRIPT_URL, params=params, timeout=10)
         return response.status_code == 200
     except:
         return False
@@ -48,21 +60,46 @@ def respond_msg(message):
     print(message)
 
 
-def find_latest_csv():
-    """Find most recent ADXL CSV file in /tmp."""
-    data_dir = "/tmp"
+def respond_batch(messages):
+    """
+    Send several console messages in a single Moonraker round-trip.
+
+    Klipper accepts newline-joined scripts, so blocks of output that
+    need no timing between lines shouldn't pay one HTTP round-trip each.
+    """
+    send_gcode("\n".join(f'RESPOND MSG="{m}"' for m in messages))
+    for m in messages:
+        print(m)
+
+
+def find_latest_csv(expected_name=None):
+    """
+    Locate the ADXL CSV for a measurement.
+
+    When the NAME passed to ACCELEROMETER_MEASURE is known, the output
+    path is deterministic (same approach as the Moonraker component) —
+    no /tmp scan needed, and no risk of grabbing a stale file from a
+    previous run. Without a name, fall back to the most recent file.
+    """
+    if expected_name is not None:
+        filepath = f"/tmp/adxl345-{expected_name}.csv"
+        return filepath if os.path.exists(filepath) else None
+
+    # scandir caches stat metadata, and a running max avoids sorting
+    # the whole directory just to take the newest entry
+    best = None
+    best_mtime = -1.0
     try:
-        files = []
-        for filename in os.listdir(data_dir):
-            if filename.startswith("adxl345-") and filename.endswith(".csv"):
-                filepath = os.path.join(data_dir, filename)
-                files.append((filepath, os.path.getmtime(filepath)))
-        if files:
-            files.sort(key=lambda x: x[1], reverse=True)
-            return files[0][0]
+        with os.scandir("/tmp") as entries:
+            for entry in entries:
+                if entry.name.startswith("adxl345-") and entry.name.endswith(".csv"):
+                    mtime = entry.stat().st_mtime
+                    if mtime > best_mtime:
+                        best_mtime = mtime
+                        best = entry.path
     except:
         pass
-    return None
+    return best
 
 
 def analyze_pluck(filepath):
@@ -76,44 +113,64 @@ def measure_belt_multi(belt_name, num_measurements=3):
 
     Returns dict with frequency, confidence, measurements, or error.
     """
-    import numpy as np
-
-    respond_msg(f"=== Belt {belt_name} Measurement ===")
-    respond_msg(f"Will take {num_measurements} measurements")
-    respond_msg("")
+    respond_batch([
+        f"=== Belt {belt_name} Measurement ===",
+        f"Will take {num_measurements} measurements",
+        "",
+    ])
 
     measurements = []
 
+    # The captures themselves must stay serial (one physical pluck at a
+    # time), but the FFT analysis of pluck i can run during the pause
+    # before pluck i+1 — the result is collected at the end of each
+    # iteration, hiding analyzer latency behind the mandatory wait.
+    executor = ThreadPoolExecutor(max_workers=1)
+    pending = None
+
+    def collect_result(future):
+        if future is None:
+            return
+        result = future.result()
+        if 'error' not in result:
+            freq = result['frequency']
+            q = result['q_factor']
+            conf = result['confidence']
+            respond_msg(f"  Result: {freq:.1f} Hz (Q={q:.0f}, {conf})")
+            measurements.append(result)
+        else:
+            respond_msg(f"  Error: {result['error']}")
+
     for i in range(num_measurements):
         respond_msg(f"Measurement {i+1}/{num_measurements}")
         respond_msg("Pluck the belt in:")
 
+        # Schedule against the monotonic clock: each respond_msg is a
+        # blocking HTTP POST whose latency would otherwise stack on top
+        # of every sleep and stretch the countdown
+        next_tick = time.monotonic()
         for j in range(3, 0, -1):
             respond_msg(f"  {j}...")
-            time.sleep(0.8)
+            next_tick += 0.8
+            time.sleep(max(0.0, next_tick - time.monotonic()))
 
         respond_msg("  >>> PLUCK NOW! <<<")
 
-        send_gcode("ACCELEROMETER_MEASURE CHIP=adxl345")
-        time.sleep(0.3)
+        measure_name = f"belt_{belt_name}_{i+1}"
 
-        time.sleep(3.0)
+        capture_start = time.monotonic()
+        send_gcode(MEASURE_START_CMD)
+        # Stop at start + 3.3s (was 0.3s settle + 3.0s capture) no
+        # matter how long the start call took
+        time.sleep(max(0.0, capture_start + 3.3 - time.monotonic()))
 
-        send_gcode(f"ACCELEROMETER_MEASURE CHIP=adxl345 NAME=belt_{belt_name}_{i+1}")
+        send_gcode(f"{MEASURE_START_CMD} NAME={measure_name}")
         time.sleep(0.5)
 
-        csv_file = find_latest_csv()
+        csv_file = find_latest_csv(measure_name)
 
         if csv_file:
-            result = analyze_pluck(csv_file)
-            if 'error' not in result:
-                freq = result['frequency']
-                q = result['q_factor']
-                conf = result['confidence']
-                respond_msg(f"  Result: {freq:.1f} Hz (Q={q:.0f}, {conf})")
-                measurements.append(result)
-            else:
-                respond_msg(f"  Error: {result['error']}")
+            pending = executor.submit(analyze_pluck, csv_file)
         else:
             respond_msg("  No data file found")
 
@@ -121,6 +178,11 @@ def measure_belt_multi(belt_name, num_measurements=3):
             respond_msg("")
             time.sleep(1.0)
 
+        collect_result(pending)
+        pending = None
+
+    executor.shutdown()
+
     respond_msg("")
     respond_msg("-" * 40)
 
@@ -141,15 +203,19 @@ def measure_belt_multi(belt_name, num_measurements=3):
     # Filter by Q-factor (keep Q > 5)
     good = [m for m in measurements if m['q_factor'] > 5] or measurements
 
-    # Filter outliers by median if high spread
+    # Hampel outlier test: a bad pluck inflates the std it would be
+    # judged against, so use the median absolute deviation instead.
+    # 1.4826*MAD estimates sigma; the 1.0 Hz floor keeps near-identical
+    # readings from collapsing the threshold to zero.
     if len(good) >= 2:
         freqs = [m['frequency'] for m in good]
-        if np.std(freqs) > 5:
-            median = np.median(freqs)
-            good = [m for m in good if abs(m['frequency'] - median) < 10] or good
+        med = statistics.median(freqs)
+        mad = statistics.median(abs(f - med) for f in freqs)
+        threshold = 3.5 * max(1.4826 * mad, 1.0)
+        good = [m for m in good if abs(m['frequency'] - med) <= threshold] or good
 
-    final_freq = float(np.mean([m['frequency'] for m in good]))
-    avg_q = float(np.mean([m['q_factor'] for m in good]))
+    final_freq = statistics.fmean(m['frequency'] for m in good)
+    avg_q = statistics.fmean(m['q_factor'] for m in good)
 
     if avg_q > 50:
         final_conf = "EXCELLENT"
@@ -176,10 +242,7 @@ def measure_belt_multi(belt_name, num_measurements=3):
 
 def compare_belts():
     """Measure and compare both belts."""
-    respond_msg("=" * 50)
-    respond_msg("BELT COMPARISON")
-    respond_msg("=" * 50)
-    respond_msg("")
+    respond_batch(["=" * 50, "BELT COMPARISON", "=" * 50, ""])
 
     result_a = measure_belt_multi('A', num_measurements=3)
 
@@ -188,10 +251,7 @@ def compare_belts():
 
     result_b = measure_belt_multi('B', num_measurements=3)
 
-    respond_msg("")
-    respond_msg("=" * 50)
-    respond_msg("COMPARISON RESULTS")
-    respond_msg("=" * 50)
+    respond_batch(["", "=" * 50, "COMPARISON RESULTS", "=" * 50])
 
     if 'error' in result_a or 'error' in result_b:
         respond_msg("Cannot compare - measurement failed")
@@ -201,10 +261,12 @@ def compare_belts():
     freq_b = result_b['frequency']
     delta = abs(freq_a - freq_b)
 
-    respond_msg(f"Belt A: {freq_a:.1f} Hz ({result_a['confidence']})")
-    respond_msg(f"Belt B: {freq_b:.1f} Hz ({result_b['confidence']})")
-    respond_msg(f"Delta:  {delta:.1f} Hz")
-    respond_msg("")
+    respond_batch([
+        f"Belt A: {freq_a:.1f} Hz ({result_a['confidence']})",
+        f"Belt B: {freq_b:.1f} Hz ({result_b['confidence']})",
+        f"Delta:  {delta:.1f} Hz",
+        "",
+    ])
 
     if delta < 2:
         respond_msg("EXCELLENT - Belts are well matched!")
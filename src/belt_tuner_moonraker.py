@@ -15,10 +15,12 @@ import asyncio
 import logging
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
 
 from ..common import RequestType
 
-from typing import TYPE_CHECKING, Any, Dict
+from typing import TYPE_CHECKING, Any, Dict, Mapping
 
 if TYPE_CHECKING:
     from ..confighelper import ConfigHelper
@@ -34,21 +36,55 @@ ANALYZER_SEARCH_PATHS = [
     "/home/biqu/Live-Belt-Tension/src",
 ]
 
-EMPTY_RESULT: Dict[str, Any] = {
+# Read-only template — copy (or use _err) for per-belt status; the
+# proxy makes accidental mutation raise instead of corrupting the shape
+EMPTY_RESULT: Mapping[str, Any] = MappingProxyType({
     'frequency': None, 'confidence': None, 'q_factor': None, 'error': None
-}
+})
+
+
+def _err(msg: str) -> Dict[str, Any]:
+    """Fresh error-shaped result in a single dict op."""
+    return {**EMPTY_RESULT, 'error': msg}
 
 
 class BeltTuner:
     def __init__(self, config: ConfigHelper) -> None:
         self.server = config.get_server()
         self.klippy_apis: KlippyAPI = self.server.lookup_component('klippy_apis')
+        # Canonicalize at config load so a malformed value fails at
+        # startup, not mid-measurement; the command prefix is built once
+        chip = config.get('chip', 'adxl345').strip().lower()
+        if not chip or any(c.isspace() for c in chip):
+            raise config.error(f"Invalid chip name: {chip!r}")
+        self.chip = chip
+        self._measure_cmd = f"ACCELEROMETER_MEASURE CHIP={chip}"
         self._status: Dict[str, Any] = {
             'A': dict(EMPTY_RESULT),
             'B': dict(EMPTY_RESULT),
         }
         self._measuring = False
         self._measure_lock = asyncio.Lock()
+        # Dedicated worker so a multi-second FFT run never holds up
+        # other users of Moonraker's shared default executor
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="belt_tuner"
+        )
+
+        # Resolve the analyzer once — the search-path probe and import
+        # are pure I/O that would otherwise repeat on every measurement
+        self._analyze_pluck_event = None
+        self._analyzer_error: str = ""
+        for path in ANALYZER_SEARCH_PATHS:
+            if os.path.exists(os.path.join(path, "belt_analyzer_v3.py")):
+                if path not in sys.path:
+                    sys.path.insert(0, path)
+                break
+        try:
+            from belt_analyzer_v3 import analyze_pluck_event
+            self._analyze_pluck_event = analyze_pluck_event
+        except ImportError as e:
+            self._analyzer_error = f"Import error: {e}"
 
         self.server.register_endpoint(
             "/server/belt_tuner/measure", RequestType.POST, self._handle_measure
@@ -75,16 +111,14 @@ class BeltTuner:
                 self._status[belt] = result
                 return result  # Moonraker wraps as {"result": <result>}
             except Exception as e:
-                error_result = dict(EMPTY_RESULT)
-                error_result['error'] = str(e)
-                self._status[belt] = error_result
+                self._status[belt] = _err(str(e))
                 raise
             finally:
                 self._measuring = False
 
     async def _do_measure(self, belt: str) -> Dict[str, Any]:
         csv_name = f"belt_web_{belt}"
-        csv_path = f"/tmp/adxl345-{csv_name}.csv"
+        csv_path = f"/tmp/{self.chip}-{csv_name}.csv"
 
         try:
             os.remove(csv_path)
@@ -92,42 +126,53 @@ class BeltTuner:
             pass
 
         # Start recording — user should pluck the belt during the 3.5 s window
-        await self.klippy_apis.run_gcode("ACCELEROMETER_MEASURE CHIP=adxl345")
+        await self.klippy_apis.run_gcode(self._measure_cmd)
         await asyncio.sleep(3.5)
-        # Stop recording; Klipper saves to /tmp/adxl345-{csv_name}.csv
-        await self.klippy_apis.run_gcode(
-            f"ACCELEROMETER_MEASURE CHIP=adxl345 NAME={csv_name}"
-        )
-        await asyncio.sleep(0.5)
+        # Stop recording; Klipper saves to /tmp/{chip}-{csv_name}.csv
+        await self.klippy_apis.run_gcode(f"{self._measure_cmd} NAME={csv_name}")
+        await self._wait_for_csv(csv_path)
 
         loop = asyncio.get_event_loop()
-        result = await loop.run_in_executor(None, self._run_analyzer, csv_path, belt)
+        result = await loop.run_in_executor(
+            self._executor, self._run_analyzer, csv_path, belt
+        )
         return result
 
-    def _run_analyzer(self, csv_path: str, belt: str) -> Dict[str, Any]:
-        for path in ANALYZER_SEARCH_PATHS:
-            if os.path.exists(os.path.join(path, "belt_analyzer_v3.py")):
-                if path not in sys.path:
-                    sys.path.insert(0, path)
-                break
+    async def _wait_for_csv(self, csv_path: str, timeout: float = 2.0) -> bool:
+        """
+        Poll until Klipper has written the CSV, with backoff.
 
-        try:
-            from belt_analyzer_v3 import analyze_pluck_event
-        except ImportError as e:
-            result = dict(EMPTY_RESULT)
-            result['error'] = f"Import error: {e}"
-            return result
+        Replaces a fixed 0.5 s sleep — on fast storage the file is there
+        almost immediately, on a slow SD card 0.5 s may not be enough.
+        """
+        loop = asyncio.get_event_loop()
+        deadline = loop.time() + timeout
+        delay = 0.05
+        while loop.time() < deadline:
+            try:
+                if os.path.getsize(csv_path) > 0:
+                    return True
+            except OSError:
+                pass
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 0.2)
+        return False
+
+    def _run_analyzer(self, csv_path: str, belt: str) -> Dict[str, Any]:
+        if self._analyze_pluck_event is None:
+            return _err(self._analyzer_error)
 
         if not os.path.exists(csv_path):
-            result = dict(EMPTY_RESULT)
-            result['error'] = f"CSV not found at {csv_path}"
-            return result
+            return _err(f"CSV not found at {csv_path}")
 
-        return analyze_pluck_event(csv_path, belt)
+        return self._analyze_pluck_event(csv_path, belt)
 
     async def _handle_status(self, web_request: WebRequest) -> Dict[str, Any]:
         return {'status': self._status, 'measuring': self._measuring}
 
+    def close(self) -> None:
+        self._executor.shutdown(wait=False)
+
     async def _handle_clear(self, web_request: WebRequest) -> Dict[str, Any]:
         belt = web_request.get_str('belt', '').upper()
         if belt in ('A', 'B'):
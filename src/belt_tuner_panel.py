@@ -1,16 +1,141 @@
+import bisect
+import functools
 import gi
 import logging
+from collections import deque
 import os
+import queue
 import threading
 import time
 
 gi.require_version("Gtk", "3.0")
-from gi.repository import Gtk, GLib
+from gi.repository import Gtk, GLib, Pango
 
 from ks_includes.screen_panel import ScreenPanel
 
 logger = logging.getLogger("KlipperScreen.BeltTuner")
 
+# Candidate analyzer locations, resolved once at import — expanduser
+# reads $HOME (and can fall back to the passwd database)
+_PROJECT_PATHS = (
+    '/home/pi/Live-Belt-Tension/src',
+    '/home/mks/Live-Belt-Tension/src',
+    '/home/biqu/Live-Belt-Tension/src',
+    os.path.join(os.path.expanduser('~'), 'Live-Belt-Tension', 'src'),
+)
+
+# Q-factor → display tier as a table lookup instead of chained branches
+_Q_TIER_BOUNDS = (10, 20)
+_Q_TIER_NAMES = ('poor', 'fair', 'good')
+
+
+def _q_tier(q):
+    return _Q_TIER_NAMES[bisect.bisect_left(_Q_TIER_BOUNDS, q)]
+
+
+# Constant markup templates hoisted out of the result callbacks — only
+# the values are bound per call
+_TPL_TUNE_QUALITY = "<small>Q={q:.0f}  ({conf})</small>"
+_TPL_DELTA = "<span color='{color}'>Δ vs Belt {belt}: {delta:.1f} Hz  {hint}</span>"
+_TPL_NO_DELTA = ("<small><span color='#888888'>"
+                 "Measure Belt {belt} to see delta</span></small>")
+_TPL_TUNE_STATUS = "<big><b>{freq:.1f} Hz</b></big>  <small>{conf}</small>"
+_TPL_MEASURE_STATUS = "<big><b>{freq:.1f} Hz</b></big>\n<small>Q={q:.0f} ({conf})</small>"
+_TPL_ERROR = "<span color='red'>Error: {error}</span>"
+_TPL_AVERAGE = ("<big>Average: <b>{avg:.1f} Hz</b></big> "
+                "<small><span color='{color}'>{conf} confidence</span> "
+                "({hq}/{n} high-quality)</small>")
+_TPL_COMPARISON = (
+    "<big><b>Belt Comparison</b></big>\n\n"
+    "Belt A: <b>{avg_a:.1f} Hz</b> ({a_hq}/{a_n} high-quality)\n"
+    "Belt B: <b>{avg_b:.1f} Hz</b> ({b_hq}/{b_n} high-quality)\n"
+    "Delta: <b>{delta:.1f} Hz</b>\n\n"
+    "<span color='{color}'><big><b>{status}</b></big></span>"
+    "{warning}"
+)
+
+# Belt delta → comparison verdict, bisect-indexed like the Q tiers
+_DELTA_BOUNDS = (2, 5, 10)
+_DELTA_TIERS = (
+    ("✓ EXCELLENT", "green"),
+    ("✓ GOOD", "blue"),
+    ("⚠ FAIR", "orange"),
+    ("✗ POOR", "red"),
+)
+
+# Tune-mode delta magnitude → readout color; the tighten/loosen hint
+# depends on the delta's sign, so only the colors are table-driven
+_TUNE_DELTA_BOUNDS = (2, 5)
+_TUNE_DELTA_COLORS = ("#00CC00", "#FFAA00", "#FF4444")
+
+# Countdown markup built once — the worker posts these as-is instead of
+# formatting a fresh string (and re-parsing markup) per tick
+_COUNTDOWN_MARKUP = tuple(
+    f"Pluck in:\n<span size='xx-large'><b>{i}</b></span>" for i in (3, 2, 1)
+)
+_PLUCK_MARKUP = "<span size='xx-large' color='#00FF00'><b>PLUCK NOW!</b></span>"
+
+# Empty-slot markup for a measurement box
+_EMPTY_FREQ = "<span size='xx-large'>---</span>"
+
+# Q-factor → (symbol, box class) as a bisect table, same scheme as
+# _q_tier but with the extra ✓✓ tier the boxes display
+_MEAS_TIER_BOUNDS = (10, 20, 50)
+_MEAS_TIERS = (
+    ("✗", "measurement-poor"),
+    ("~", "measurement-fair"),
+    ("✓", "measurement-good"),
+    ("✓✓", "measurement-good"),
+)
+
+
+@functools.lru_cache(maxsize=128)
+def _freq_markup(freq_tenths):
+    """Box frequency markup, memoized on the displayed 0.1 Hz value."""
+    return f"<span size='xx-large'>{freq_tenths / 10:.1f}</span>"
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_status_markup(markup):
+    """Parsed (attrs, text) for a status string — the countdown and the
+    fixed Ready/Analyzing messages repeat, so they parse once."""
+    _, attrs, text, _ = Pango.parse_markup(markup, -1, '\x00')
+    return attrs, text
+
+# One template for all five measurement boxes — instantiated via
+# Gtk.Builder instead of widget-by-widget imperative construction
+_MEASUREMENT_BOX_UI = """\
+<interface>
+  <object class="GtkEventBox" id="event_box">
+    <child>
+      <object class="GtkFrame" id="frame">
+        <property name="width-request">100</property>
+        <property name="height-request">100</property>
+        <child>
+          <object class="GtkBox">
+            <property name="orientation">vertical</property>
+            <property name="spacing">5</property>
+            <property name="halign">center</property>
+            <property name="valign">center</property>
+            <child>
+              <object class="GtkLabel" id="freq_label"/>
+            </child>
+            <child>
+              <object class="GtkLabel" id="unit_label">
+                <property name="label">Hz</property>
+              </object>
+            </child>
+            <child>
+              <object class="GtkLabel" id="quality_label"/>
+            </child>
+          </object>
+        </child>
+      </object>
+    </child>
+  </object>
+</interface>
+"""
+
 
 class Panel(ScreenPanel):
     """
@@ -27,13 +152,56 @@ class Panel(ScreenPanel):
         super().__init__(screen, title)
 
         self.current_belt = 'A'
-        self.measurements = {'A': [], 'B': []}
         self.max_measurements = 5
+        # Bounded deques: append is O(1) and the maxlen backstops the
+        # cap even if a new write path forgets the start_measurement
+        # guard (which stays, so the user decides what gets dropped)
+        self.measurements = {
+            'A': deque(maxlen=self.max_measurements),
+            'B': deque(maxlen=self.max_measurements),
+        }
+        # Per-belt average frequency, invalidated whenever the belt's
+        # measurement list changes
+        self._avg_cache = {'A': None, 'B': None}
+
+        # Measurement G-code differs only by belt — build both up front
+        self._measure_start_cmd = "ACCELEROMETER_MEASURE CHIP=adxl345"
+        self._measure_stop_cmds = {
+            belt: f"ACCELEROMETER_MEASURE CHIP=adxl345 NAME=belt_{belt}_ks"
+            for belt in ('A', 'B')
+        }
+        self._csv_paths = {
+            belt: f"/tmp/adxl345-belt_{belt}_ks.csv" for belt in ('A', 'B')
+        }
         self.measuring = False
-        self.measurement_thread = None
+        self._countdown_idx = 0
+        self._last_status = None
+        self._redraw_pending = False
+        # One long-lived worker thread fed by a 1-slot queue: no thread
+        # spawn per button press, and at most one measurement can be
+        # in flight by construction
+        self._job_queue = queue.Queue(maxsize=1)
+        self._worker_thread = threading.Thread(target=self._worker_loop, daemon=True)
+        self._worker_thread.start()
+        # /tmp prune runs every N measurements, not per pluck
+        self._cleanup_counter = 0
+
+        # Resolve the analyzer once — the path probe (4 stat calls) and
+        # import would otherwise repeat on every pluck, and sys.path
+        # would grow by one entry each time
+        self._analyze_pluck, self._analyzer_error = self._resolve_analyzer()
         self.tune_mode = False
         self.last_tune_result = None
 
+        # Pre-parsed attribute lists for the big tune-mode frequency
+        # readout: set_text + set_attributes skips Pango's markup parser
+        # on every result. Color lives in the tune-freq-* CSS classes
+        # (belt_tuner.css), so only result/idle lists are needed here
+        _, self._tune_freq_attrs, _, _ = Pango.parse_markup(
+            "<span size='xxx-large'><b>x</b></span>", -1, '\x00')
+        _, self._tune_freq_idle_attrs, _, _ = Pango.parse_markup(
+            "<span size='xxx-large'>x</span>", -1, '\x00')
+
         # ── Main container ────────────────────────────────────────────────────
         main_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=5)
         main_box.set_margin_start(10)
@@ -66,6 +234,14 @@ class Panel(ScreenPanel):
 
         main_box.pack_start(header_box, False, False, 0)
 
+        # Style contexts fetched once — belt switches and mode toggles
+        # reuse them instead of a GObject lookup per call
+        self._button_ctx = {
+            'A': self.belt_a_button.get_style_context(),
+            'B': self.belt_b_button.get_style_context(),
+            'tune': self.tune_button.get_style_context(),
+        }
+
         # ── MEASURE MODE: 5-box grid ──────────────────────────────────────────
         self.measure_widget = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=5)
 
@@ -75,10 +251,20 @@ class Panel(ScreenPanel):
         self.measurement_grid.set_halign(Gtk.Align.CENTER)
 
         self.measurement_boxes = []
+        self.measurement_widgets = []  # (style_context, freq_label, quality_label)
         for i in range(5):
-            box = self.create_measurement_box(i)
-            self.measurement_boxes.append(box)
-            self.measurement_grid.attach(box, i, 0, 1, 1)
+            event_box, frame, freq_label, quality_label = self.create_measurement_box(i)
+            self.measurement_boxes.append(event_box)
+            # The frame itself is never touched after construction — only
+            # its style context is, so cache that instead
+            self.measurement_widgets.append(
+                (frame.get_style_context(), freq_label, quality_label)
+            )
+            self.measurement_grid.attach(event_box, i, 0, 1, 1)
+        # Per-box state as last drawn, so refreshes only touch the
+        # style engine and Pango when a box actually changes
+        self._meas_class = [None] * 5
+        self._meas_shown = [(_EMPTY_FREQ, "")] * 5
 
         self.measure_widget.pack_start(self.measurement_grid, True, True, 0)
         main_box.pack_start(self.measure_widget, True, True, 0)
@@ -97,7 +283,9 @@ class Panel(ScreenPanel):
         tune_inner.set_margin_bottom(15)
 
         self.tune_freq_label = Gtk.Label()
-        self.tune_freq_label.set_markup("<span size='xxx-large'>---</span>")
+        self.tune_freq_label.set_text("---")
+        self.tune_freq_label.set_attributes(self._tune_freq_idle_attrs)
+        self._tune_freq_ctx = self.tune_freq_label.get_style_context()
         tune_inner.pack_start(self.tune_freq_label, False, False, 0)
 
         self.tune_hz_label = Gtk.Label(label="Hz")
@@ -132,6 +320,16 @@ class Panel(ScreenPanel):
         self.start_button.connect("clicked", self.start_measurement)
         main_box.pack_start(self.start_button, False, False, 5)
 
+        # Buttons locked while a measurement runs, collected once so
+        # enable/disable is a plain list walk
+        self._control_buttons = [
+            self.start_button,
+            self.belt_a_button,
+            self.belt_b_button,
+            self.tune_button,
+        ]
+        self._buttons_sensitive = True
+
         # ── MEASURE MODE action buttons ───────────────────────────────────────
         self.measure_actions = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=10)
         self.measure_actions.set_halign(Gtk.Align.CENTER)
@@ -172,6 +370,23 @@ class Panel(ScreenPanel):
         self.info_label.set_margin_top(5)
         main_box.pack_start(self.info_label, False, False, 0)
 
+        # One reusable clear-measurement dialog — constructing a
+        # MessageDialog per tap means window creation, CSS application
+        # and layout each time; only the title text varies
+        self._confirm_dialog = Gtk.MessageDialog(
+            transient_for=self._screen,
+            modal=True,
+            message_type=Gtk.MessageType.QUESTION,
+            buttons=Gtk.ButtonsType.NONE,
+            text="",
+        )
+        self._confirm_dialog.format_secondary_text("Remove this measurement?")
+        self._confirm_dialog.add_button("Clear", Gtk.ResponseType.YES)
+        self._confirm_dialog.add_button("Close", Gtk.ResponseType.CANCEL)
+        self._confirm_dialog.connect("delete-event", lambda d, e: d.hide_on_delete())
+        self._confirm_dialog.connect("response", self._on_confirm_response)
+        self._confirm_index = None
+
         self.content.add(main_box)
 
         self.update_belt_selection()
@@ -181,32 +396,51 @@ class Panel(ScreenPanel):
 
     def create_measurement_box(self, index):
         """Create a single measurement display box, tappable to clear that measurement."""
-        event_box = Gtk.EventBox()
-        event_box.connect("button-press-event", self.on_measurement_clicked, index)
-
-        frame = Gtk.Frame()
-        frame.set_size_request(100, 100)
+        builder = Gtk.Builder.new_from_string(_MEASUREMENT_BOX_UI, -1)
 
-        box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=5)
-        box.set_halign(Gtk.Align.CENTER)
-        box.set_valign(Gtk.Align.CENTER)
+        event_box = builder.get_object("event_box")
+        event_box.connect("button-press-event", self.on_measurement_clicked, index)
 
-        freq_label = Gtk.Label()
+        freq_label = builder.get_object("freq_label")
         freq_label.set_name(f"measurement-freq-{index}")
-        freq_label.set_markup("<span size='xx-large'>---</span>")
-        box.pack_start(freq_label, False, False, 0)
-
-        unit_label = Gtk.Label(label="Hz")
-        unit_label.set_name(f"measurement-unit-{index}")
-        box.pack_start(unit_label, False, False, 0)
+        freq_label.set_markup(_EMPTY_FREQ)
 
-        quality_label = Gtk.Label()
+        builder.get_object("unit_label").set_name(f"measurement-unit-{index}")
+        quality_label = builder.get_object("quality_label")
         quality_label.set_name(f"measurement-quality-{index}")
-        box.pack_start(quality_label, False, False, 0)
 
-        frame.add(box)
-        event_box.add(frame)
-        return event_box
+        return event_box, builder.get_object("frame"), freq_label, quality_label
+
+    # ── Measurement aggregates ────────────────────────────────────────────────
+
+    def _invalidate_avg(self, belt):
+        self._avg_cache[belt] = None
+
+    def _belt_stats(self, belt):
+        """
+        (average frequency, high-quality count) for a belt, or None if it
+        has no measurements. One pass over the deque, cached until the
+        belt's measurements change.
+        """
+        stats = self._avg_cache[belt]
+        if stats is None:
+            meas = self.measurements[belt]
+            if not meas:
+                return None
+            total = 0.0
+            high_quality = 0
+            for m in meas:
+                total += m['frequency']
+                if m['q_factor'] > 20:
+                    high_quality += 1
+            stats = (total / len(meas), high_quality)
+            self._avg_cache[belt] = stats
+        return stats
+
+    def _belt_avg(self, belt):
+        """Average frequency for a belt, or None if it has no measurements."""
+        stats = self._belt_stats(belt)
+        return None if stats is None else stats[0]
 
     # ── Belt selection ────────────────────────────────────────────────────────
 
@@ -218,16 +452,32 @@ class Panel(ScreenPanel):
         if self.tune_mode:
             self._reset_tune_display()
         else:
-            self.update_measurements_display()
-            self.update_average_display()
+            self._schedule_redraw()
 
-    def update_belt_selection(self):
-        if self.current_belt == 'A':
-            self.belt_a_button.get_style_context().add_class("button_active")
-            self.belt_b_button.get_style_context().remove_class("button_active")
+    def _schedule_redraw(self):
+        # Debounce: a burst of belt taps within the 50 ms window is
+        # coalesced into a single grid walk and relayout
+        if self._redraw_pending:
+            return
+        self._redraw_pending = True
+        GLib.timeout_add(50, self._flush_redraw)
+
+    def _flush_redraw(self):
+        self._redraw_pending = False
+        self.update_measurements_display()
+        self.update_average_display()
+        return False
+
+    def _set_active(self, key, active):
+        ctx = self._button_ctx[key]
+        if active:
+            ctx.add_class("button_active")
         else:
-            self.belt_b_button.get_style_context().add_class("button_active")
-            self.belt_a_button.get_style_context().remove_class("button_active")
+            ctx.remove_class("button_active")
+
+    def update_belt_selection(self):
+        self._set_active('A', self.current_belt == 'A')
+        self._set_active('B', self.current_belt == 'B')
 
     # ── Tune mode toggle ──────────────────────────────────────────────────────
 
@@ -241,7 +491,7 @@ class Panel(ScreenPanel):
             self.average_label.hide()
             self.info_label.hide()
             self.tune_widget.show()
-            self.tune_button.get_style_context().add_class("button_active")
+            self._set_active('tune', True)
             self._reset_tune_display()
             self.update_status("<big>Tune Mode — Ready</big>")
         else:
@@ -251,14 +501,24 @@ class Panel(ScreenPanel):
             self.measure_actions.show()
             self.average_label.show()
             self.info_label.show()
-            self.tune_button.get_style_context().remove_class("button_active")
+            self._set_active('tune', False)
             self.last_tune_result = None
             self.update_status("<big>Ready</big>")
             self.update_measurements_display()
             self.update_average_display()
 
+    def _set_tune_tier(self, tier):
+        # Color tier is a CSS class toggle, not a markup rebuild —
+        # tune-freq-* rules in belt_tuner.css carry the hex colors
+        for name in ('tune-freq-good', 'tune-freq-fair', 'tune-freq-poor'):
+            self._tune_freq_ctx.remove_class(name)
+        if tier is not None:
+            self._tune_freq_ctx.add_class(f"tune-freq-{tier}")
+
     def _reset_tune_display(self):
-        self.tune_freq_label.set_markup("<span size='xxx-large'>---</span>")
+        self.tune_freq_label.set_text("---")
+        self.tune_freq_label.set_attributes(self._tune_freq_idle_attrs)
+        self._set_tune_tier(None)
         self.tune_quality_label.set_text("")
         self.tune_delta_label.set_text("")
         self.tune_actions.hide()
@@ -271,42 +531,30 @@ class Panel(ScreenPanel):
         q = result['q_factor']
         conf = result['confidence']
 
-        if q > 20:
-            color = "#00CC00"
-        elif q > 10:
-            color = "#FFAA00"
-        else:
-            color = "#FF4444"
-
-        self.tune_freq_label.set_markup(
-            f"<span size='xxx-large' color='{color}'><b>{freq:.1f}</b></span>"
-        )
-        self.tune_quality_label.set_markup(f"<small>Q={q:.0f}  ({conf})</small>")
+        self.tune_freq_label.set_text(f"{freq:.1f}")
+        self.tune_freq_label.set_attributes(self._tune_freq_attrs)
+        self._set_tune_tier(_q_tier(q))
+        self.tune_quality_label.set_markup(_TPL_TUNE_QUALITY.format(q=q, conf=conf))
 
         # Delta vs other belt
         other_belt = 'B' if self.current_belt == 'A' else 'A'
-        other_meas = self.measurements[other_belt]
-        if other_meas:
-            other_avg = sum(m['frequency'] for m in other_meas) / len(other_meas)
+        other_avg = self._belt_avg(other_belt)
+        if other_avg is not None:
             delta = freq - other_avg
             abs_delta = abs(delta)
-            arrow = "↑ tighten" if delta < 0 else "↓ loosen"
-            if abs_delta < 2:
-                d_color = "#00CC00"
-                d_text = f"Δ vs Belt {other_belt}: {abs_delta:.1f} Hz  ✓ matched"
-            elif abs_delta < 5:
-                d_color = "#FFAA00"
-                d_text = f"Δ vs Belt {other_belt}: {abs_delta:.1f} Hz  {arrow}"
+            tier = bisect.bisect(_TUNE_DELTA_BOUNDS, abs_delta)
+            d_color = _TUNE_DELTA_COLORS[tier]
+            if tier == 0:
+                hint = "✓ matched"
             else:
-                d_color = "#FF4444"
-                d_text = f"Δ vs Belt {other_belt}: {abs_delta:.1f} Hz  {arrow}"
-            self.tune_delta_label.set_markup(f"<span color='{d_color}'>{d_text}</span>")
+                hint = "↑ tighten" if delta < 0 else "↓ loosen"
+            self.tune_delta_label.set_markup(_TPL_DELTA.format(
+                color=d_color, belt=other_belt, delta=abs_delta, hint=hint
+            ))
         else:
-            self.tune_delta_label.set_markup(
-                f"<small><span color='#888888'>Measure Belt {'B' if self.current_belt == 'A' else 'A'} to see delta</span></small>"
-            )
+            self.tune_delta_label.set_markup(_TPL_NO_DELTA.format(belt=other_belt))
 
-        self.update_status(f"<big><b>{freq:.1f} Hz</b></big>  <small>{conf}</small>")
+        self.update_status(_TPL_TUNE_STATUS.format(freq=freq, conf=conf))
         self.tune_actions.show()
 
     def tune_again(self, widget):
@@ -316,6 +564,7 @@ class Panel(ScreenPanel):
     def tune_save_and_exit(self, widget):
         if self.last_tune_result:
             self.measurements[self.current_belt].append(self.last_tune_result)
+            self._invalidate_avg(self.current_belt)
         self.toggle_tune_mode(widget)
 
     # ── Measure mode display ──────────────────────────────────────────────────
@@ -323,54 +572,47 @@ class Panel(ScreenPanel):
     def update_measurements_display(self):
         measurements = self.measurements[self.current_belt]
 
-        for i, event_box in enumerate(self.measurement_boxes):
-            box_frame = event_box.get_child()   # EventBox → Frame
-            box = box_frame.get_child()          # Frame → Box
-            freq_label = box.get_children()[0]
-            quality_label = box.get_children()[2]
-
-            box_frame.get_style_context().remove_class("measurement-good")
-            box_frame.get_style_context().remove_class("measurement-fair")
-            box_frame.get_style_context().remove_class("measurement-poor")
-            box_frame.get_style_context().remove_class("measurement-old")
-
-            if i < len(measurements):
+        last = len(measurements) - 1
+        for i, (ctx, freq_label, quality_label) in enumerate(self.measurement_widgets):
+            if i <= last:
                 meas = measurements[i]
-                freq = meas['frequency']
-                q = meas['q_factor']
-
-                freq_label.set_markup(f"<span size='xx-large'>{freq:.1f}</span>")
-
-                if q > 50:
-                    quality_label.set_text("✓✓")
-                    style_class = "measurement-good"
-                elif q > 20:
-                    quality_label.set_text("✓")
-                    style_class = "measurement-good"
-                elif q > 10:
-                    quality_label.set_text("~")
-                    style_class = "measurement-fair"
-                else:
-                    quality_label.set_text("✗")
-                    style_class = "measurement-poor"
-
-                if i == len(measurements) - 1:
-                    box_frame.get_style_context().add_class(style_class)
-                else:
-                    box_frame.get_style_context().add_class("measurement-old")
+                markup = _freq_markup(round(meas['frequency'] * 10))
+                symbol, style_class = _MEAS_TIERS[
+                    bisect.bisect_left(_MEAS_TIER_BOUNDS, meas['q_factor'])
+                ]
+                new_class = style_class if i == last else "measurement-old"
             else:
-                freq_label.set_markup("<span size='xx-large'>---</span>")
-                quality_label.set_text("")
+                markup = _EMPTY_FREQ
+                symbol = ""
+                new_class = None
+
+            # Re-setting identical markup still costs a Pango parse and
+            # relayout, so skip boxes whose content hasn't changed
+            shown = (markup, symbol)
+            if shown != self._meas_shown[i]:
+                freq_label.set_markup(markup)
+                quality_label.set_text(symbol)
+                self._meas_shown[i] = shown
+
+            # One remove + one add, and only when the box's class
+            # actually changed — each toggle invalidates the box style
+            old_class = self._meas_class[i]
+            if new_class != old_class:
+                if old_class is not None:
+                    ctx.remove_class(old_class)
+                if new_class is not None:
+                    ctx.add_class(new_class)
+                self._meas_class[i] = new_class
 
     def update_average_display(self):
-        measurements = self.measurements[self.current_belt]
+        stats = self._belt_stats(self.current_belt)
 
-        if len(measurements) == 0:
+        if stats is None:
             self.average_label.set_text("")
             return
 
-        avg_freq = sum(m['frequency'] for m in measurements) / len(measurements)
-        high_quality = len([m for m in measurements if m['q_factor'] > 20])
+        avg_freq, high_quality = stats
+        measurements = self.measurements[self.current_belt]
 
         if high_quality >= len(measurements) * 0.6:
             confidence_text = "HIGH"
@@ -382,11 +624,10 @@ class Panel(ScreenPanel):
             confidence_text = "LOW"
             color = "orange"
 
-        self.average_label.set_markup(
-            f"<big>Average: <b>{avg_freq:.1f} Hz</b></big> "
-            f"<small><span color='{color}'>{confidence_text} confidence</span> "
-            f"({high_quality}/{len(measurements)} high-quality)</small>"
-        )
+        self.average_label.set_markup(_TPL_AVERAGE.format(
+            avg=avg_freq, color=color, conf=confidence_text,
+            hq=high_quality, n=len(measurements)
+        ))
 
     # ── Measurement execution ─────────────────────────────────────────────────
 
@@ -402,97 +643,191 @@ class Panel(ScreenPanel):
             return
 
         self.measuring = True
-        self.start_button.set_sensitive(False)
-        self.belt_a_button.set_sensitive(False)
-        self.belt_b_button.set_sensitive(False)
-        self.tune_button.set_sensitive(False)
-
-        self.measurement_thread = threading.Thread(target=self.measurement_worker)
-        self.measurement_thread.daemon = True
-        self.measurement_thread.start()
+        self._set_buttons_sensitive(False)
+
+        # The countdown is pure UI, so it runs on the main loop as a
+        # timeout source; the worker thread only wakes once the user
+        # has been told to pluck
+        self._countdown_idx = 0
+        self.update_status(_COUNTDOWN_MARKUP[0])
+        GLib.timeout_add(800, self._countdown_tick)
+
+    def _countdown_tick(self):
+        self._countdown_idx += 1
+        if self._countdown_idx < len(_COUNTDOWN_MARKUP):
+            self.update_status(_COUNTDOWN_MARKUP[self._countdown_idx])
+            return True
+        self.update_status(_PLUCK_MARKUP)
+        self._job_queue.put(self.measurement_worker)
+        return False
+
+    def _worker_loop(self):
+        """Long-lived measurement worker; jobs arrive via the 1-slot queue."""
+        while True:
+            job = self._job_queue.get()
+            try:
+                job()
+            finally:
+                self._job_queue.task_done()
 
     def measurement_worker(self):
+        idle_add = GLib.idle_add
         try:
-            for i in [3, 2, 1]:
-                GLib.idle_add(self.update_status, f"Pluck in:\n<span size='xx-large'><b>{i}</b></span>")
-                time.sleep(0.8)
-
-            GLib.idle_add(self.update_status, "<span size='xx-large' color='#00FF00'><b>PLUCK NOW!</b></span>")
-
-            self._screen._ws.klippy.gcode_script("ACCELEROMETER_MEASURE CHIP=adxl345")
-            time.sleep(0.3)
-            time.sleep(3.0)
-            self._screen._ws.klippy.gcode_script(f"ACCELEROMETER_MEASURE CHIP=adxl345 NAME=belt_{self.current_belt}_ks")
-            time.sleep(0.5)
+            self._screen._ws.klippy.gcode_script(self._measure_start_cmd)
+            time.sleep(3.3)  # 0.3s settle + 3.0s capture window
+            self._screen._ws.klippy.gcode_script(self._measure_stop_cmds[self.current_belt])
+            self._wait_for_csv(self._csv_paths[self.current_belt])
 
-            GLib.idle_add(self.update_status, "Analyzing...")
+            idle_add(self.update_status, "Analyzing...")
             result = self.analyze_measurement()
 
             if result and 'error' not in result:
                 if not self.tune_mode:
                     self.measurements[self.current_belt].append(result)
+                    self._invalidate_avg(self.current_belt)
                 else:
                     self.last_tune_result = result
-                GLib.idle_add(self.measurement_complete, result)
+                error = None
             else:
-                error_msg = result.get('error', 'Unknown error') if result else 'Analysis failed'
-                GLib.idle_add(self.measurement_failed, error_msg)
+                error = result.get('error', 'Unknown error') if result else 'Analysis failed'
+                result = None
 
         except Exception as e:
             logger.error(f"Measurement error: {e}")
-            GLib.idle_add(self.measurement_failed, str(e))
+            result = None
+            error = str(e)
         finally:
             self.measuring = False
-            GLib.idle_add(self.enable_buttons)
-
-    def analyze_measurement(self):
-        try:
-            import sys
-            import glob
-
-            project_paths = [
-                '/home/pi/Live-Belt-Tension/src',
-                '/home/mks/Live-Belt-Tension/src',
-                '/home/biqu/Live-Belt-Tension/src',
-                os.path.join(os.path.expanduser('~'), 'Live-Belt-Tension', 'src'),
-            ]
-
-            analyzer_found = False
-            for path in project_paths:
-                analyzer_path = os.path.join(path, 'belt_analyzer_v3.py')
-                if os.path.exists(analyzer_path):
-                    sys.path.insert(0, path)
-                    analyzer_found = True
-                    break
+            # One idle dispatch per measurement: result labels and
+            # button re-enable land in a single main-loop callback
+            idle_add(self._measurement_finished, result, error)
 
-            if not analyzer_found:
-                return {'error': 'belt_analyzer_v3.py not found. Please copy to ~/Live-Belt-Tension/src/'}
+    def _measurement_finished(self, result, error):
+        if error is None:
+            self.measurement_complete(result)
+        else:
+            self.measurement_failed(error)
+        self.enable_buttons()
 
-            from belt_analyzer_v3 import analyze_pluck_v3 as analyze_pluck_event
-            files = glob.glob('/tmp/adxl345-*.csv')
-            if not files:
-                return {'error': 'No data file found'}
+    @staticmethod
+    def _resolve_analyzer():
+        """Locate and import belt_analyzer_v3. Returns (callable, error)."""
+        import sys
 
-            files.sort(key=os.path.getmtime)
-            latest = files[-1]
+        for path in _PROJECT_PATHS:
+            if os.path.exists(os.path.join(path, 'belt_analyzer_v3.py')):
+                if path not in sys.path:
+                    sys.path.insert(0, path)
+                break
+        else:
+            return None, 'belt_analyzer_v3.py not found. Please copy to ~/Live-Belt-Tension/src/'
 
-            if len(files) > 10:
-                for old_file in files[:-10]:
-                    try:
-                        os.remove(old_file)
-                    except:
-                        pass
+        try:
+            from belt_analyzer_v3 import analyze_pluck_v3
+            return analyze_pluck_v3, None
+        except ImportError as e:
+            return None, f'Import error: {e}'
 
-            return analyze_pluck_event(latest, self.current_belt, debug=False)
+    def analyze_measurement(self):
+        try:
+            if self._analyze_pluck is None:
+                return {'error': self._analyzer_error}
+
+            # The measurement NAME is ours, so the output path is known —
+            # no /tmp scan on the hot path and no chance of picking up a
+            # stale CSV from an earlier run
+            latest = self._csv_paths[self.current_belt]
+            if not os.path.exists(latest):
+                latest = self._find_latest_csv()
+                if latest is None:
+                    return {'error': 'No data file found'}
+
+            # Schedule the prune for when the main loop has nothing
+            # better to do — the user is waiting on the analyzer here,
+            # and the unlinks can cost tens of ms on an SD card
+            self._cleanup_counter += 1
+            if self._cleanup_counter >= 10:
+                self._cleanup_counter = 0
+                GLib.idle_add(self._cleanup_old_csvs,
+                              priority=GLib.PRIORITY_LOW)
+
+            return self._analyze_pluck(latest, self.current_belt, debug=False)
 
         except Exception as e:
             logger.error(f"Analysis error: {e}")
             return {'error': str(e)}
 
+    @staticmethod
+    def _wait_for_csv(csv_path, timeout=2.0):
+        """
+        Poll until Klipper has written the CSV, with backoff.
+
+        Replaces a fixed 0.5 s sleep — on fast storage the file lands
+        almost immediately, on a slow SD card 0.5 s may not be enough.
+        """
+        deadline = time.monotonic() + timeout
+        delay = 0.05
+        while time.monotonic() < deadline:
+            try:
+                if os.path.getsize(csv_path) > 0:
+                    return True
+            except OSError:
+                pass
+            time.sleep(delay)
+            delay = min(delay * 2, 0.2)
+        return False
+
+    @staticmethod
+    def _find_latest_csv():
+        """Newest ADXL CSV in /tmp, or None. scandir caches the stat data."""
+        best = None
+        best_mtime = -1.0
+        try:
+            with os.scandir('/tmp') as entries:
+                for entry in entries:
+                    if entry.name.startswith('adxl345-') and entry.name.endswith('.csv'):
+                        mtime = entry.stat().st_mtime
+                        if mtime > best_mtime:
+                            best_mtime = mtime
+                            best = entry.path
+        except OSError:
+            pass
+        return best
+
+    @staticmethod
+    def _cleanup_old_csvs(keep=10):
+        """Prune all but the newest ADXL CSVs. Tolerates concurrent removals."""
+        try:
+            with os.scandir('/tmp') as entries:
+                files = [
+                    (entry.stat().st_mtime, entry.path)
+                    for entry in entries
+                    if entry.name.startswith('adxl345-') and entry.name.endswith('.csv')
+                ]
+        except OSError:
+            return
+        files.sort()
+        for _, old_file in files[:-keep]:
+            try:
+                os.remove(old_file)
+            except OSError:
+                pass
+
     # ── Callbacks ─────────────────────────────────────────────────────────────
 
     def update_status(self, message):
-        self.status_label.set_markup(message)
+        if message == self._last_status:
+            return
+        self._last_status = message
+        try:
+            attrs, text = _parse_status_markup(message)
+        except GLib.Error:
+            # Not valid markup (e.g. an error string with '<' in it) —
+            # show it verbatim rather than dropping it
+            self.status_label.set_text(message)
+            return
+        self.status_label.set_text(text)
+        self.status_label.set_attributes(attrs)
 
     def measurement_complete(self, result):
         if self.tune_mode:
@@ -501,19 +836,26 @@ class Panel(ScreenPanel):
             freq = result['frequency']
             q = result['q_factor']
             conf = result['confidence']
-            self.update_status(f"<big><b>{freq:.1f} Hz</b></big>\n<small>Q={q:.0f} ({conf})</small>")
+            self.update_status(_TPL_MEASURE_STATUS.format(freq=freq, q=q, conf=conf))
             self.update_measurements_display()
             self.update_average_display()
 
     def measurement_failed(self, error):
-        self.update_status(f"<span color='red'>Error: {error}</span>")
+        self.update_status(_TPL_ERROR.format(error=error))
         self._screen.show_popup_message(f"Measurement failed: {error}", level=2)
 
     def enable_buttons(self):
-        self.start_button.set_sensitive(True)
-        self.belt_a_button.set_sensitive(True)
-        self.belt_b_button.set_sensitive(True)
-        self.tune_button.set_sensitive(True)
+        self._set_buttons_sensitive(True)
+
+    def _set_buttons_sensitive(self, sensitive):
+        # The four controls always flip together — skip the GObject
+        # calls (and the notify::sensitive restyles they trigger) when
+        # the state is already right
+        if self._buttons_sensitive == sensitive:
+            return
+        self._buttons_sensitive = sensitive
+        for button in self._control_buttons:
+            button.set_sensitive(sensitive)
 
     def on_measurement_clicked(self, widget, event, index):
         """Tap a measurement box to clear that specific measurement."""
@@ -527,30 +869,31 @@ class Panel(ScreenPanel):
         freq = meas['frequency']
         q = meas['q_factor']
 
-        dialog = Gtk.MessageDialog(
-            transient_for=self._screen,
-            modal=True,
-            message_type=Gtk.MessageType.QUESTION,
-            buttons=Gtk.ButtonsType.NONE,
-            text=f"Measurement #{index + 1}: {freq:.1f} Hz  (Q={q:.0f})",
+        # show + response signal instead of run(): run() nests a main
+        # loop, freezing every other UI update while the user decides
+        dialog = self._confirm_dialog
+        dialog.set_property(
+            'text', f"Measurement #{index + 1}: {freq:.1f} Hz  (Q={q:.0f})"
         )
-        dialog.format_secondary_text("Remove this measurement?")
-        dialog.add_button("Clear", Gtk.ResponseType.YES)
-        dialog.add_button("Close", Gtk.ResponseType.CANCEL)
+        self._confirm_index = index
+        dialog.show()
 
-        response = dialog.run()
-        dialog.destroy()
-
-        if response == Gtk.ResponseType.YES:
-            self.measurements[self.current_belt].pop(index)
-            self.update_measurements_display()
-            self.update_average_display()
+    def _on_confirm_response(self, dialog, response):
+        dialog.hide()
+        index, self._confirm_index = self._confirm_index, None
+        if response != Gtk.ResponseType.YES or index is None:
+            return
+        measurements = self.measurements[self.current_belt]
+        if index < len(measurements):
+            del measurements[index]
+            self._invalidate_avg(self.current_belt)
+            self._schedule_redraw()
 
     def clear_measurements(self, widget):
         """Clear all measurements for current belt."""
-        self.measurements[self.current_belt] = []
-        self.update_measurements_display()
-        self.update_average_display()
+        self.measurements[self.current_belt].clear()
+        self._invalidate_avg(self.current_belt)
+        self._schedule_redraw()
         self.update_status("<big>Ready</big>")
 
     def show_comparison(self, widget):
@@ -564,37 +907,21 @@ class Panel(ScreenPanel):
             )
             return
 
-        avg_a = sum(m['frequency'] for m in a_meas) / len(a_meas)
-        avg_b = sum(m['frequency'] for m in b_meas) / len(b_meas)
+        avg_a, a_hq = self._belt_stats('A')
+        avg_b, b_hq = self._belt_stats('B')
         delta = abs(avg_a - avg_b)
 
-        a_hq = len([m for m in a_meas if m['q_factor'] > 20])
-        b_hq = len([m for m in b_meas if m['q_factor'] > 20])
-
-        if delta < 2:
-            status = "✓ EXCELLENT"
-            color = "green"
-        elif delta < 5:
-            status = "✓ GOOD"
-            color = "blue"
-        elif delta < 10:
-            status = "⚠ FAIR"
-            color = "orange"
-        else:
-            status = "✗ POOR"
-            color = "red"
+        status, color = _DELTA_TIERS[bisect.bisect(_DELTA_BOUNDS, delta)]
 
         confidence_warning = ""
         if a_hq < len(a_meas) * 0.5 or b_hq < len(b_meas) * 0.5:
             confidence_warning = "\n<small>(Some measurements had low quality)</small>"
 
-        message = (
-            f"<big><b>Belt Comparison</b></big>\n\n"
-            f"Belt A: <b>{avg_a:.1f} Hz</b> ({a_hq}/{len(a_meas)} high-quality)\n"
-            f"Belt B: <b>{avg_b:.1f} Hz</b> ({b_hq}/{len(b_meas)} high-quality)\n"
-            f"Delta: <b>{delta:.1f} Hz</b>\n\n"
-            f"<span color='{color}'><big><b>{status}</b></big></span>"
-            f"{confidence_warning}"
+        message = _TPL_COMPARISON.format(
+            avg_a=avg_a, a_hq=a_hq, a_n=len(a_meas),
+            avg_b=avg_b, b_hq=b_hq, b_n=len(b_meas),
+            delta=delta, color=color, status=status,
+            warning=confidence_warning,
         )
 
         self._screen.show_popup_message(message, level=1)